@@ -22,23 +22,412 @@ Example usage:
 
 import argparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import exceptions as urllib3_exceptions
+from urllib3.util import Retry
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+import hashlib
 import json
+import os
+import queue
 import sys
 import shlex
+import string
+import threading
+from urllib.parse import urljoin, urlsplit
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib decoder
+    orjson = None
 
 # Base URL for the target API, in this case D&D5
 API_BASE_URL = "https://www.dnd5eapi.co/api"
 
+# JSON helpers: orjson when installed, stdlib json otherwise. Both accept raw
+# bytes, which skips requests' charset detection and text decode.
+_loads = orjson.loads if orjson else json.loads
+
+
+def _dumps(obj):
+    """Serialises obj to compact JSON bytes."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def format_json(obj):
+    """Returns obj pretty-printed with two-space indentation."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2)
+
+
+# Characters that make shlex.split differ from str.split
+_SHELL_CHARS = frozenset('"\'\\')
+
+# Lowercases ASCII letters and turns spaces into dashes in a single pass.
+_SLUG_TABLE = str.maketrans(string.ascii_uppercase + " ",
+                            string.ascii_lowercase + "-")
+
+
+@lru_cache(maxsize=1024)
+def _slug(name):
+    """Converts an entity name such as 'Acid Arrow' to its URL slug."""
+    if not name.isascii():
+        name = name.lower()  # The table only covers ASCII letters
+    return name.translate(_SLUG_TABLE)
+
+
+def print_json(obj):
+    """Pretty-prints obj to stdout.
+
+    With orjson the encoded bytes go straight to the underlying binary
+    stream, skipping the decode to str and re-encode that print() needs.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson and buffer is not None:
+        sys.stdout.flush()  # Keep ordering with text already printed
+        buffer.write(orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        ))
+    else:
+        print(format_json(obj))
+
+
+# Shared HTTP session so every request reuses the same keep-alive
+# connection pool instead of paying a new TCP/TLS handshake each time.
+# Every request goes to a single host, so one host pool is enough; its size
+# still has to cover the concurrent workers used by fetch_many. Transient
+# failures (rate limiting, gateway errors, refused connections) are retried
+# with backoff by the adapter, so the fetchers only see errors that
+# persisted. Read timeouts are not retried and connection attempts only
+# once, with a short connect timeout: a server that stopped answering would
+# otherwise keep the user waiting for several full timeouts. When status
+# retries run out the last response is returned, so raise_for_status still
+# reports its status code.
+SESSION = requests.Session()
+REQUEST_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+RETRY_POLICY = Retry(
+    total=3,
+    connect=1,
+    read=False,  # Re-raise read errors, so timeouts surface as Timeout
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET"],
+    raise_on_status=False,
+)
+SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=16,
+                                      max_retries=RETRY_POLICY))
+SESSION.headers.update({
+    "Accept": "application/json",
+    "User-Agent": "dndapicli/1.0",
+})
+
+# Persistent cache directory. Each URL is stored as a SHA1-named JSON file
+# holding the parsed body plus its ETag/Last-Modified validators, so later
+# runs only need a conditional GET (a 304 carries no body).
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "dndapicli"
+)
+
+# Endpoints the user queried most recently, most recent first. Their lists
+# are prefetched in the background on the next startup.
+RECENT_ENDPOINTS_PATH = os.path.join(CACHE_DIR, "recent.txt")
+RECENT_LIMIT = 4
+PREFETCH_WORKERS = 4
+# Concurrency cap for '<endpoint> --all', to stay polite to the free API
+FETCH_ALL_WORKERS = 8
+# Maximum linked resources queued for idle-time prefetch per detail lookup
+PREFETCH_LINK_LIMIT = 16
+
+# In-memory cache of parsed JSON responses, keyed by _cache_key(url). The
+# API data is effectively static, so repeated lookups within a session skip
+# the network. Only successful responses are stored; errors propagate and
+# are retried.
+_response_cache = {}
+
+# Entity lists split into parallel columns ({"names", "indices", "urls"}),
+# keyed like _response_cache. Name scans for display and --search then walk
+# a single flat list of strings instead of a list of dicts.
+_list_cache = {}
+
+# Absolute URL of each endpoint, as advertised by the API index. Lookups
+# are built from these so typed commands hit the same paths as the links
+# inside API responses (e.g. '/api/2014/spells/...').
+_endpoint_urls = {}
+
+
+def _cache_key(url):
+    """Returns the cache key for url: its path (and query) on the API host.
+
+    Typed lookups, list links and prefetched references all resolve to the
+    same key this way, however the URL was spelled.
+    """
+    parts = urlsplit(url)
+    path = parts.path.rstrip('/') or '/'
+    return f"{path}?{parts.query}" if parts.query else path
+
+
+def endpoint_url(base_url, entity_type):
+    """Returns the URL of an endpoint, preferring the API index's path."""
+    return _endpoint_urls.get(entity_type) or f"{base_url}/{entity_type}"
+
+
+def _disk_cache_path(key):
+    """Returns the on-disk cache file path for a cache key."""
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, f"{digest}.json")
+
+
+def _read_disk_cache(key):
+    """Returns the stored cache entry for key, or None if unavailable."""
+    try:
+        with open(_disk_cache_path(key), "rb") as f:
+            entry = _loads(f.read())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get("key") != key:
+        return None
+    return entry
+
+
+def _write_disk_cache(key, response, data):
+    """Stores data and the response validators for key. Best effort."""
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return  # Nothing to revalidate against on the next run
+    entry = {
+        "key": key,
+        "etag": etag,
+        "last_modified": last_modified,
+        "body": data,
+    }
+    path = _disk_cache_path(key)
+    # Prefetch threads and the REPL may write the same key concurrently
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(_dumps(entry))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # A cache we cannot write is just a cache miss next time
+
+
+def _read_body(response):
+    """Reads a streamed response body, raising only requests exceptions.
+
+    response.raw bypasses requests' error wrapping, so urllib3 failures
+    while the body is read are translated here as iter_content would,
+    except that a stalled body is reported as a timeout.
+    """
+    try:
+        return response.raw.read(decode_content=True)
+    except urllib3_exceptions.ReadTimeoutError as e:
+        raise requests.exceptions.ReadTimeout(e)
+    except urllib3_exceptions.DecodeError as e:
+        raise requests.exceptions.ContentDecodingError(e)
+    except urllib3_exceptions.ProtocolError as e:
+        raise requests.exceptions.ChunkedEncodingError(e)
+    except urllib3_exceptions.HTTPError as e:
+        raise requests.exceptions.ConnectionError(e)
+
+
+def get_json(url):
+    """Returns the parsed JSON at url, serving repeat requests from cache.
+
+    Falls back to the on-disk cache with a conditional GET when the URL has
+    not been seen in this session.
+    """
+    key = _cache_key(url)
+    try:
+        return _response_cache[key]
+    except KeyError:
+        pass
+    entry = _read_disk_cache(key)
+    headers = {}
+    if entry is not None:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    # Stream the body so it is read straight off the socket into the
+    # decoder instead of being buffered by requests first.
+    with SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT,
+                     stream=True) as response:
+        if response.status_code == 200:
+            data = _loads(_read_body(response))
+            _write_disk_cache(key, response, data)
+        else:
+            # Consume the empty (304) or short error body as plain bytes,
+            # never decoded to text; an unread body would make the session
+            # close this keep-alive connection instead of pooling it.
+            body = response.content
+            if response.status_code == 304 and entry is not None:
+                data = entry["body"]
+            else:
+                response.raise_for_status()
+                data = _loads(body)
+                _write_disk_cache(key, response, data)
+        # After a redirect, also answer for the URL the data really lives at
+        final_key = _cache_key(response.url)
+    _response_cache[key] = data
+    _response_cache[final_key] = data
+    return data
+
+
+def clear_cache():
+    """Drops all cached API responses, in memory and on disk."""
+    _response_cache.clear()
+    _list_cache.clear()
+    try:
+        names = os.listdir(CACHE_DIR)
+    except OSError:
+        return
+    for name in names:
+        # .tmp files are left behind if a daemon thread dies mid-write
+        if name.endswith((".json", ".tmp")):
+            try:
+                os.remove(os.path.join(CACHE_DIR, name))
+            except OSError:
+                pass
+
+
+def load_recent_endpoints():
+    """Returns the recently used endpoints, most recent first.
+
+    Read once at startup; the REPL then keeps the list in memory and hands
+    it to record_recent_endpoint.
+    """
+    try:
+        with open(RECENT_ENDPOINTS_PATH, "r", encoding="utf-8") as f:
+            recent = [line.strip() for line in f if line.strip()]
+    except OSError:
+        return []
+    return recent[:RECENT_LIMIT]
+
+
+def record_recent_endpoint(recent, endpoint):
+    """Moves endpoint to the front of recent, in place.
+
+    The file is only rewritten when the order actually changes, so repeat
+    commands on the same endpoint cost no I/O. Saving is best effort.
+    """
+    if recent[:1] == [endpoint]:
+        return
+    if endpoint in recent:
+        recent.remove(endpoint)
+    recent.insert(0, endpoint)
+    del recent[RECENT_LIMIT:]
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(RECENT_ENDPOINTS_PATH, "w", encoding="utf-8") as f:
+            f.write("\n".join(recent) + "\n")
+    except OSError:
+        pass
+
+
+def _fetch_quietly(url):
+    """Returns the parsed JSON at url, or None on any request failure."""
+    try:
+        return get_json(url)
+    except (requests.exceptions.RequestException, ValueError):
+        return None
+
+
+def fetch_many(urls, max_workers=PREFETCH_WORKERS):
+    """Fetches urls concurrently over the shared session.
+
+    Each worker draws a keep-alive connection from the session's pool, so a
+    burst of lookups overlaps its round trips instead of queueing on one
+    connection. Returns a dict mapping each URL to its parsed JSON, or to
+    None if that request failed.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(urls, executor.map(_fetch_quietly, urls)))
+
+
+# URLs waiting to be fetched by the idle-time prefetcher thread
+_prefetch_queue = queue.Queue()
+
+# Caps how many startup prefetches run at once
+_prefetch_slots = threading.BoundedSemaphore(PREFETCH_WORKERS)
+
+
+def _prefetcher():
+    """Warms the response cache with queued URLs, one at a time."""
+    while True:
+        url = _prefetch_queue.get()
+        try:
+            if _cache_key(url) not in _response_cache:
+                _fetch_quietly(url)
+        except Exception:
+            pass  # A bad link must not stop prefetching for the session
+
+
+def start_prefetcher():
+    """Starts the background thread that drains the prefetch queue.
+
+    It runs while the REPL waits for input, so follow-up lookups are often
+    already cached by the time the user types them.
+    """
+    threading.Thread(target=_prefetcher, daemon=True).start()
+
+
+def _linked_urls(entity_data):
+    """Yields the URLs of API resources referenced by an entity."""
+    for value in entity_data.values():
+        refs = value if isinstance(value, list) else (value,)
+        for ref in refs:
+            if isinstance(ref, dict) and isinstance(ref.get('url'), str):
+                yield ref['url']
+
+
+def queue_linked_prefetch(base_url, entity_data):
+    """Queues the resources an entity links to (e.g. a spell's school)."""
+    if not isinstance(entity_data, dict):
+        return
+    for url in islice(_linked_urls(entity_data), PREFETCH_LINK_LIMIT):
+        _prefetch_queue.put(urljoin(base_url, url))
+
+
+def _prefetch_in_background(url):
+    """Warms the response cache for url, sharing the prefetch slots."""
+    with _prefetch_slots:
+        _fetch_quietly(url)
+
+
+def prefetch_entity_lists(base_url, endpoints):
+    """Fetches the lists for endpoints in the background.
+
+    Results land in the response cache, so the user's first command for one
+    of these endpoints is served without waiting on the network. Daemon
+    threads are used (not an executor, whose workers are joined at exit),
+    so quitting never waits on a slow prefetch.
+    """
+    for endpoint in endpoints:
+        threading.Thread(target=_prefetch_in_background,
+                         args=(endpoint_url(base_url, endpoint),),
+                         daemon=True).start()
+
 
 def fetch_available_endpoints(base_url):
     """Fetches the list of available top-level endpoints."""
     print(f"[*] Attempting to connect to API index at: {base_url}")
     try:
-        response = requests.get(base_url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = get_json(base_url)
         if isinstance(data, dict):
             endpoints = list(data.keys())
+            _endpoint_urls.update(
+                (name, urljoin(base_url, path))
+                for name, path in data.items() if isinstance(path, str)
+            )
             print(f"[*] Successfully fetched {len(endpoints)} endpoints.")
             endpoints.sort()
             return endpoints
@@ -65,29 +454,47 @@ def fetch_available_endpoints(base_url):
         return None
 
 
+def _entity_columns(items):
+    """Splits a list of entity records into parallel name/index/url lists."""
+    records = [item if isinstance(item, dict) else {} for item in items]
+    return {
+        "names": _display_names(items),
+        "indices": [record.get('index') for record in records],
+        "urls": [record.get('url') for record in records],
+    }
+
+
 def fetch_entity_list(base_url, entity_type):
-    """Fetches the list of all entities of a given type."""
-    url = f"{base_url}/{entity_type}"
+    """Fetches the list of all entities of a given type.
+
+    The list is returned as parallel columns: a dict holding "names",
+    "indices" and "urls" lists, all in API order.
+    """
+    url = endpoint_url(base_url, entity_type)
     print(f"[*] Fetching list from: {url}")
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        columns = _list_cache.get(_cache_key(url))
+        if columns is not None:
+            return columns
+        data = get_json(url)
         list_key = 'results'
         if list_key in data and isinstance(data[list_key], list):
-            return data[list_key]
+            items = data[list_key]
+        elif isinstance(data, list):
+            print(
+                f"[*] Warning: Fetched list directly from {url} "
+                f"(no '{list_key}' key found).", file=sys.stderr
+            )
+            items = data
         else:
-            if isinstance(data, list):
-                print(
-                    f"[*] Warning: Fetched list directly from {url} "
-                    f"(no '{list_key}' key found).", file=sys.stderr
-                )
-                return data
             print(f"[!] Unexpected API response format for list at {url}",
                   file=sys.stderr)
             print(f"    Expected a JSON object with a '{list_key}' list.",
                   file=sys.stderr)
             return None
+        columns = _entity_columns(items)
+        _list_cache[_cache_key(url)] = columns
+        return columns
     except requests.exceptions.Timeout:
         print(f"[!] Request timed out while fetching list from {url}",
               file=sys.stderr)
@@ -103,13 +510,11 @@ def fetch_entity_list(base_url, entity_type):
 def fetch_entity_data(base_url, entity_type, entity_name_or_index):
     """Fetches data for a specific entity from the API."""
     # Use the provided name directly, converting to lowercase slug for URL
-    slug = str(entity_name_or_index).lower().replace(' ', '-')
-    url = f"{base_url}/{entity_type}/{slug}"
+    slug = _slug(str(entity_name_or_index))
+    url = f"{endpoint_url(base_url, entity_type)}/{slug}"
     print(f"[*] Fetching details from: {url}")
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        return response.json()
+        return get_json(url)
     except requests.exceptions.Timeout:
         print(f"[!] Request timed out while fetching details from {url}",
               file=sys.stderr)
@@ -137,89 +542,179 @@ def fetch_entity_data(base_url, entity_type, entity_name_or_index):
         return None
 
 
-def display_entity_list(entity_list, entity_type):
-    """Displays a list of entity names/indices. Attempts common keys."""
-    if not entity_list:
+def fetch_all_entities(base_url, entity_type):
+    """Fetches the details of every entity of a given type concurrently.
+
+    Returns a list of (label, data) pairs in list order, where data is None
+    for any item that could not be fetched, or None if the list itself
+    could not be fetched.
+    """
+    columns = fetch_entity_list(base_url, entity_type)
+    if columns is None:
+        return None
+    labels = []
+    urls = []
+    for name, index, url in zip(columns["names"], columns["indices"],
+                                columns["urls"]):
+        if url:
+            url = urljoin(base_url, url)
+        elif index:
+            url = f"{endpoint_url(base_url, entity_type)}/{index}"
+        else:
+            continue
+        labels.append(index or name)
+        urls.append(url)
+    print(f"[*] Fetching details for {len(urls)} {entity_type}...")
+    results = fetch_many(urls, max_workers=FETCH_ALL_WORKERS)
+    return [(label, results[url]) for label, url in zip(labels, urls)]
+
+
+def _display_name(item):
+    """Returns the label shown for one entry of an entity list."""
+    if not isinstance(item, dict):
+        # Handle cases where the list contains non-dict items
+        return item
+    display_name = item.get('name', item.get('index'))
+    if not display_name:
+        # Fall back to the last URL segment, flagging numeric IDs
+        url = item.get('url')
+        if isinstance(url, str):
+            _, sep, tail = url.strip('/').rpartition('/')
+            display_name = f"ID: {tail}" if sep and tail.isdigit() else tail
+    # Fallback to the raw item if no suitable key found
+    return display_name or item
+
+
+def display_entity_details(entities, entity_type):
+    """Displays the JSON details of each (label, data) pair in entities."""
+    # Bind hot lookups to locals; this loop can run for hundreds of items
+    write = sys.stdout.write
+    stderr = sys.stderr
+    _print_json = print_json
+    for label, entity_data in entities:
+        write(f"\n--- Details for: {entity_type}/{label} (JSON) ---\n")
+        if entity_data is None:
+            print("[!] Could not fetch details.", file=stderr)
+        else:
+            _print_json(entity_data)
+    write("-------------------------------------------\n\n")
+
+
+_get_name = itemgetter('name')
+
+
+def _display_names(entity_list):
+    """Returns the display labels (always strings) for an entity list.
+
+    API lists are nearly always uniform {index, name, url} records, so the
+    labels are first pulled with a single C-level itemgetter pass; only
+    lists of another shape fall back to inspecting each entry.
+    """
+    try:
+        names = list(map(_get_name, entity_list))
+    except (KeyError, TypeError):
+        names = None
+    if names is None or not all(names):
+        display_name = _display_name
+        return [str(display_name(item)) for item in entity_list]
+    # str() returns str values unchanged, so this only converts odd names
+    return list(map(str, names))
+
+
+def search_entity_list(columns, needle):
+    """Returns the entity names containing needle, ignoring case."""
+    needle = needle.casefold()
+    return [name for name in columns["names"] if needle in name.casefold()]
+
+
+def display_entity_list(names, entity_type, title=None):
+    """Displays a list of entity names/indices under an optional title."""
+    if not names:
         print(f"No {entity_type} found or error fetching list.")
         return
-    print(f"\n--- Available {entity_type.capitalize()} ---")
-    name_key = 'name'
-    index_key = 'index'
-    url_key = 'url'
-    items_displayed = 0
-    for item in entity_list:
-        if isinstance(item, dict):
-            display_name = item.get(name_key, item.get(index_key))
-            if not display_name and url_key in item:
-                try:
-                    parts = item[url_key].strip('/').split('/')
-                    if len(parts) > 1 and parts[-1].isdigit():
-                        display_name = f"ID: {parts[-1]}"
-                    elif len(parts) > 0:
-                        display_name = parts[-1]
-                except Exception:
-                    pass  # Ignore parsing errors for URL fallback
-            if display_name:
-                print(f"- {display_name}")
-                items_displayed += 1
-            else:
-                # Fallback if no suitable key found
-                print(f"- {item}")
-                items_displayed += 1
-        else:
-            # Handle cases where the list contains non-dict items
-            print(f"- {item}")
-            items_displayed += 1
-    if items_displayed == 0:
-        print(
-            f"Could not extract displayable names/indices from the "
-            f"{entity_type} list."
-        )
-    print("-------------------------------\n")  # Removed f-string F541
-    print(f"Use '{entity_type} <name_or_index>' to get details (JSON format).")
+    if title is None:
+        title = f"Available {entity_type.capitalize()}"
+    # Build the whole listing first and emit it with a single write
+    lines = "".join([f"- {name}\n" for name in names])
+    sys.stdout.write(
+        f"\n--- {title} ---\n"
+        f"{lines}"
+        "-------------------------------\n\n"
+        f"Use '{entity_type} <name_or_index>' to get details (JSON format).\n"
+    )
 
 
-def display_help(available_endpoints):
-    """Displays help information using the dynamically fetched endpoints."""
-    print("\n--- Help ---")
-    print(f"API Base URL: {API_BASE_URL}")
-    print("Usage: <endpoint> [name_or_index ...]")  # Updated usage string
-    print("\nAvailable Endpoints (fetched from API):")
-    col_width = max(len(ep) for ep in available_endpoints) + 2
+def render_help(available_endpoints):
+    """Builds the help text for the dynamically fetched endpoints.
+
+    The endpoint list does not change during a session, so this is done
+    once at startup and display_help just writes out the result.
+    """
+    col_width = max((len(ep) for ep in available_endpoints), default=0) + 2
     cols = 3
-    for i, ep in enumerate(available_endpoints):
-        print(f"{ep:<{col_width}}", end="")
-        if (i + 1) % cols == 0:
-            print()
-    if len(available_endpoints) % cols != 0:
-        print()
-    print("\nCommands:")
-    print("  <endpoint>             : List all available items for that "
-          "endpoint (e.g., 'monsters')")
-    print("  <endpoint> <name ...>  : Show details for a specific item "
-          "(output is raw JSON)")
-    print("                         : Name can be multiple words "
-          "(e.g., 'spells Acid Arrow')")
-    print("  help                   : Show this help message.")
-    print("  exit / quit / q        : Exit the application.")
-    print("\nNote: Names/indices often match the list output "
-          "(case-insensitive lookup attempted).")
-    print("--- End Help ---\n")
+    grid = "\n".join(
+        "".join(f"{ep:<{col_width}}"
+                for ep in available_endpoints[i:i + cols])
+        for i in range(0, len(available_endpoints), cols)
+    )
+    return (
+        "\n--- Help ---\n"
+        f"API Base URL: {API_BASE_URL}\n"
+        "Usage: <endpoint> [name_or_index ...]\n"
+        "\nAvailable Endpoints (fetched from API):\n"
+        f"{grid}\n"
+        "\nCommands:\n"
+        "  <endpoint>             : List all available items for that "
+        "endpoint (e.g., 'monsters')\n"
+        "  <endpoint> <name ...>  : Show details for a specific item "
+        "(output is raw JSON)\n"
+        "                         : Name can be multiple words "
+        "(e.g., 'spells Acid Arrow')\n"
+        "  <endpoint> --search T  : List items whose name contains T "
+        "(case-insensitive)\n"
+        "  <endpoint> --all       : Show details for every item "
+        "(also '<endpoint> *')\n"
+        "  cache clear            : Forget cached API responses.\n"
+        "  help                   : Show this help message.\n"
+        "  exit / quit / q        : Exit the application.\n"
+        "\nNote: Names/indices often match the list output "
+        "(case-insensitive lookup attempted).\n"
+        "--- End Help ---\n\n"
+    )
+
+
+def display_help(help_text):
+    """Displays the help text prepared by render_help."""
+    sys.stdout.write(help_text)
 
 
 # --- Main Execution ---
 
 if __name__ == "__main__":
-    # 1. Fetch available endpoints on startup
+    # 1. Fetch available endpoints on startup. This also resolves DNS and
+    # completes the TLS handshake on the shared session, so the user's
+    # first command reuses an already open connection.
     available_endpoints = fetch_available_endpoints(API_BASE_URL)
-    if available_endpoints is None:
+    if not available_endpoints:  # None on error, [] for an empty index
         print(
             "\n[!] Critical Error: Could not initialize API endpoints. "
             "Exiting.", file=sys.stderr
         )
         sys.exit(1)
 
-    # 3. Build the Parser
+    # 2. Warm the cache with the lists the user looked at last time
+    recent_endpoints = load_recent_endpoints()
+    prefetch_entity_lists(
+        API_BASE_URL,
+        [ep for ep in recent_endpoints if ep in available_endpoints]
+    )
+    start_prefetcher()
+
+    # Precomputed lookups for the REPL hot path
+    endpoints_set = frozenset(available_endpoints)
+    help_text = render_help(available_endpoints)
+
+    # 3. Build the Parser (only used to report invalid commands)
     parser = argparse.ArgumentParser(
         description='Interactive API JSON Navigator.',
         prog="",
@@ -255,42 +750,77 @@ if __name__ == "__main__":
             if cmd_lower in ['exit', 'quit', 'q']:
                 break
             if cmd_lower == 'help':
-                display_help(available_endpoints)
+                display_help(help_text)
+                continue
+            if cmd_lower == 'cache clear':
+                clear_cache()
+                print("[*] Response cache cleared.")
                 continue
 
-            # Split input
+            # Split input. Plain whitespace splitting gives the same result
+            # as shlex unless the input contains quotes or escapes.
             try:
-                command_parts = shlex.split(user_input)
+                if _SHELL_CHARS.isdisjoint(user_input):
+                    command_parts = user_input.split()
+                else:
+                    command_parts = shlex.split(user_input)
             except ValueError:
                 print(f"[!] Error: Unmatched quotes in input: {user_input}",
                       file=sys.stderr)
                 continue
 
-            # Parse the input parts
-            try:
-                args = parser.parse_args(command_parts)
-            except SystemExit:
-                # Prevent argparse default SystemExit on --help or error
-                continue
-            except Exception as parse_err:
-                print(f"[!] Error parsing command: {parse_err}",
-                      file=sys.stderr)
+            # The grammar is just '<endpoint> [name ...]', so a set lookup
+            # replaces argparse for valid input. argparse still runs on
+            # anything else to print its usual usage/error message.
+            if not command_parts or command_parts[0] not in endpoints_set:
+                try:
+                    parser.parse_args(command_parts)
+                except SystemExit:
+                    # Prevent argparse default SystemExit on --help or error
+                    pass
+                except Exception as parse_err:
+                    print(f"[!] Error parsing command: {parse_err}",
+                          file=sys.stderr)
                 continue
 
-            # Execute based on parsed arguments
-            selected_endpoint = args.entity_type
+            # Execute the command
+            selected_endpoint = command_parts[0]
+            entity_name_parts = command_parts[1:]
+            record_recent_endpoint(recent_endpoints, selected_endpoint)
             # Check if the list of name parts is empty or not
-            # `args.entity_name_parts` will be [] if no name was given,
+            # `entity_name_parts` will be [] if no name was given,
             # or ['Acid', 'Arrow'] etc.
-            if not args.entity_name_parts:
+            if entity_name_parts in (['--all'], ['*']):
+                # Fetch every item's details concurrently
+                entities = fetch_all_entities(API_BASE_URL,
+                                              selected_endpoint)
+                if entities is not None:
+                    display_entity_details(entities, selected_endpoint)
+            elif not entity_name_parts:
                 # List items for the endpoint (No name parts provided)
-                entity_list = fetch_entity_list(API_BASE_URL,
-                                                selected_endpoint)
-                if entity_list is not None:
-                    display_entity_list(entity_list, selected_endpoint)
+                columns = fetch_entity_list(API_BASE_URL, selected_endpoint)
+                if columns is not None:
+                    display_entity_list(columns["names"], selected_endpoint)
+            elif entity_name_parts == ['--search']:
+                print(f"[!] Usage: {selected_endpoint} --search <text>",
+                      file=sys.stderr)
+            elif entity_name_parts[0] == '--search':
+                # Filter the list by a case-insensitive name substring
+                needle = ' '.join(entity_name_parts[1:])
+                columns = fetch_entity_list(API_BASE_URL, selected_endpoint)
+                if columns is not None:
+                    matches = search_entity_list(columns, needle)
+                    if matches:
+                        display_entity_list(
+                            matches, selected_endpoint,
+                            title=f"{selected_endpoint.capitalize()} "
+                                  f"matching '{needle}'"
+                        )
+                    else:
+                        print(f"No {selected_endpoint} matching '{needle}'.")
             else:
                 # Join the parts back into a single name string
-                item_name = ' '.join(args.entity_name_parts)
+                item_name = ' '.join(entity_name_parts)
                 # Get specific item details using the joined name
                 entity_data = fetch_entity_data(API_BASE_URL,
                                                 selected_endpoint, item_name)
@@ -298,8 +828,9 @@ if __name__ == "__main__":
                     # Use the reconstructed item_name in the header
                     print(f"\n--- Details for: {selected_endpoint}/{item_name}"
                           " (JSON) ---")
-                    print(json.dumps(entity_data, indent=2))
+                    print_json(entity_data)
                     print("-------------------------------------------\n")
+                    queue_linked_prefetch(API_BASE_URL, entity_data)
 
         except KeyboardInterrupt:
             print("\nExiting...")